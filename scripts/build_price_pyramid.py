@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Highland Park Commercial Buildings - Hexbin Price Pyramid Builder
+
+Bins the Yelp-enriched building footprints into a hexagonal grid at several
+zoom levels so that zoomed-out map views can draw a few hundred cells instead
+of every building polygon.
+
+Hexagons are laid out in Web Mercator meters and sized in screen pixels, so a
+cell at zoom z always covers roughly HEX_RADIUS_PX pixels on the map.
+
+USAGE:
+    python scripts/build_price_pyramid.py
+
+REQUIREMENTS:
+    pip install requests   (imported via fetch_yelp_prices.py)
+
+INPUT:
+    - public/highland_park_commercial_buildings_with_prices.geojson
+      (created by scripts/fetch_yelp_prices.py)
+
+OUTPUT:
+    - public/price_pyramid/hex_z{zoom}.geojson   one file per zoom level
+    - public/price_pyramid/index.json            zoom levels, cell sizes, file names
+
+Each cell has the properties:
+    count             number of buildings whose centroid falls in the cell
+    mean_price_level  mean Yelp price level (1-4) of buildings that have one
+    yelp_share        share of buildings with a Yelp business match
+"""
+
+import json
+import math
+from pathlib import Path
+
+from fetch_yelp_prices import get_building_centroid
+
+# Get the directory where this script is located
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# ==============================
+# CONFIGURATION
+# ==============================
+INPUT_FILE = PROJECT_ROOT / "public" / "highland_park_commercial_buildings_with_prices.geojson"
+OUTPUT_DIR = PROJECT_ROOT / "public" / "price_pyramid"
+
+# Zoom levels to build; above the highest one the map draws real footprints
+ZOOM_LEVELS = [11, 12, 13, 14, 15]
+
+# Hexagon radius (center to corner) in screen pixels at each zoom level
+HEX_RADIUS_PX = 12
+
+# Decimal places kept for output coordinates (6 places is ~10 cm)
+COORD_PRECISION = 6
+
+# Web Mercator constants
+EARTH_RADIUS = 6378137.0
+METERS_PER_PIXEL_Z0 = 2 * math.pi * EARTH_RADIUS / 256
+
+SQRT3 = math.sqrt(3)
+
+# ==============================
+# HELPER FUNCTIONS
+# ==============================
+
+def lonlat_to_mercator(lon, lat):
+    """Project WGS84 lon/lat to Web Mercator meters"""
+    x = math.radians(lon) * EARTH_RADIUS
+    y = math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) * EARTH_RADIUS
+    return x, y
+
+def mercator_to_lonlat(x, y):
+    """Unproject Web Mercator meters back to WGS84 lon/lat"""
+    lon = math.degrees(x / EARTH_RADIUS)
+    lat = math.degrees(2 * math.atan(math.exp(y / EARTH_RADIUS)) - math.pi / 2)
+    return lon, lat
+
+def hex_radius_for_zoom(zoom):
+    """Hexagon radius in Mercator meters for the given zoom level"""
+    return HEX_RADIUS_PX * METERS_PER_PIXEL_Z0 / (2 ** zoom)
+
+def point_to_hex(x, y, radius):
+    """
+    Return the axial (q, r) coordinates of the pointy-top hexagon containing
+    the point, using cube rounding.
+    """
+    q = (SQRT3 / 3 * x - y / 3) / radius
+    r = (2 / 3 * y) / radius
+
+    # Round in cube coordinates, then fix the component with the largest error
+    s = -q - r
+    rq, rr, rs = round(q), round(r), round(s)
+    dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+    if dq > dr and dq > ds:
+        rq = -rr - rs
+    elif dr > ds:
+        rr = -rq - rs
+
+    return int(rq), int(rr)
+
+def hex_polygon(q, r, radius):
+    """Return the closed lon/lat ring of hexagon (q, r)"""
+    cx = radius * SQRT3 * (q + r / 2)
+    cy = radius * 1.5 * r
+
+    ring = []
+    for i in range(6):
+        angle = math.radians(60 * i - 30)
+        lon, lat = mercator_to_lonlat(cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+        ring.append([round(lon, COORD_PRECISION), round(lat, COORD_PRECISION)])
+    ring.append(ring[0])
+
+    return ring
+
+def load_building_points(input_file):
+    """
+    Load the enriched buildings and reduce each one to its Mercator centroid
+    plus the fields the pyramid aggregates.
+    """
+    with open(str(input_file), 'r') as f:
+        geojson_data = json.load(f)
+
+    points = []
+    for building in geojson_data['features']:
+        props = building['properties']
+        centroid = get_building_centroid(building['geometry'])
+        x, y = lonlat_to_mercator(centroid['longitude'], centroid['latitude'])
+        points.append((x, y, props.get('price_level'), bool(props.get('yelp_data_found'))))
+
+    return points
+
+def aggregate_zoom(points, zoom):
+    """Bin points into hexagons for one zoom level and return a FeatureCollection"""
+    radius = hex_radius_for_zoom(zoom)
+
+    # (q, r) -> [count, price_sum, price_count, yelp_count]
+    cells = {}
+    for x, y, price_level, yelp_found in points:
+        cell = cells.setdefault(point_to_hex(x, y, radius), [0, 0, 0, 0])
+        cell[0] += 1
+        if price_level is not None:
+            cell[1] += price_level
+            cell[2] += 1
+        if yelp_found:
+            cell[3] += 1
+
+    features = []
+    for (q, r), (count, price_sum, price_count, yelp_count) in sorted(cells.items()):
+        features.append({
+            "type": "Feature",
+            "properties": {
+                "count": count,
+                "mean_price_level": round(price_sum / price_count, 2) if price_count else None,
+                "yelp_share": round(yelp_count / count, 3)
+            },
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [hex_polygon(q, r, radius)]
+            }
+        })
+
+    return {
+        "type": "FeatureCollection",
+        "features": features
+    }
+
+def save_compact_geojson(data, file_path):
+    """Save GeoJSON without indentation or extra whitespace"""
+    with open(str(file_path), 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+# ==============================
+# MAIN SCRIPT
+# ==============================
+
+def main():
+    print("=" * 60)
+    print("🔷 Highland Park Commercial Buildings - Hexbin Price Pyramid")
+    print("=" * 60)
+
+    print("\n📂 Loading enriched buildings data...")
+    print(f"   Looking for: {INPUT_FILE}")
+    points = load_building_points(INPUT_FILE)
+    print(f"   ✅ Loaded {len(points)} buildings")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    levels = []
+    for zoom in ZOOM_LEVELS:
+        collection = aggregate_zoom(points, zoom)
+        file_name = f"hex_z{zoom}.geojson"
+        save_compact_geojson(collection, OUTPUT_DIR / file_name)
+
+        levels.append({
+            "zoom": zoom,
+            "file": file_name,
+            "cell_radius_m": round(hex_radius_for_zoom(zoom), 2),
+            "cells": len(collection['features'])
+        })
+        print(f"   🔷 z{zoom}: {len(collection['features'])} cells -> {file_name}")
+
+    index = {
+        "source": INPUT_FILE.name,
+        "buildings": len(points),
+        "hex_radius_px": HEX_RADIUS_PX,
+        "levels": levels
+    }
+    with open(str(OUTPUT_DIR / "index.json"), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+
+    print(f"\n💾 Saved pyramid to: {OUTPUT_DIR}")
+    print("\n" + "=" * 60)
+
+if __name__ == "__main__":
+    main()
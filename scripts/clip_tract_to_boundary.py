@@ -5,8 +5,10 @@ This will make the tract "hug" the outline of the Highland Park boundary.
 """
 
 import json
-from shapely.geometry import Polygon, shape
-from shapely.ops import unary_union
+from shapely import make_valid
+from shapely.geometry import mapping, shape
+
+from validate_geometry import polygonal_part
 
 def load_geojson(file_path):
     """Load a GeoJSON file and return the data."""
@@ -36,7 +38,7 @@ def clip_tract_to_boundary(tract_geojson_path, boundary_geojson_path, output_pat
     
     # Find the Highland Park boundary polygon
     hp_boundary_feature = boundary_data['features'][0]
-    hp_boundary_geom = shape(hp_boundary_feature['geometry'])
+    hp_boundary_geom = polygonal_part(make_valid(shape(hp_boundary_feature['geometry'])))
     
     # Process each specified tract
     modified_tracts = []
@@ -47,45 +49,22 @@ def clip_tract_to_boundary(tract_geojson_path, boundary_geojson_path, output_pat
                 print(f"Found tract {tract_id}")
                 found = True
                 
-                # Get the tract polygon
-                tract_geom = shape(feature['geometry'])
+                # Get the tract polygon, repairing it first so the intersection
+                # does not fail or fall back to slow GEOS code paths
+                tract_geom = polygonal_part(make_valid(shape(feature['geometry'])))
                 
                 # Clip the tract to the Highland Park boundary using intersection
                 # This will create a polygon that only includes the parts inside Highland Park
                 clipped_geom = tract_geom.intersection(hp_boundary_geom)
                 
-                # Convert back to GeoJSON format
+                # Keep every polygonal part; a MultiPolygon result stays a MultiPolygon
+                clipped_geom = polygonal_part(clipped_geom)
                 if clipped_geom.is_empty:
                     print(f"Warning: Intersection is empty for tract {tract_id}")
                     continue
                 
-                # Handle different geometry types (Polygon, MultiPolygon, etc.)
-                if clipped_geom.geom_type == 'Polygon':
-                    # Single polygon
-                    coords = [list(clipped_geom.exterior.coords)]
-                    # Add holes if any
-                    for interior in clipped_geom.interiors:
-                        coords.append(list(interior.coords))
-                    
-                    feature['geometry'] = {
-                        'type': 'Polygon',
-                        'coordinates': coords
-                    }
-                elif clipped_geom.geom_type == 'MultiPolygon':
-                    # Multiple polygons - take the largest one
-                    polygons = list(clipped_geom.geoms)
-                    largest = max(polygons, key=lambda p: p.area)
-                    coords = [list(largest.exterior.coords)]
-                    for interior in largest.interiors:
-                        coords.append(list(interior.coords))
-                    
-                    feature['geometry'] = {
-                        'type': 'Polygon',
-                        'coordinates': coords
-                    }
-                else:
-                    print(f"Warning: Unexpected geometry type: {clipped_geom.geom_type}")
-                    continue
+                # Convert back to GeoJSON format
+                feature['geometry'] = mapping(clipped_geom)
                 
                 print(f"Successfully clipped tract {tract_id} to Highland Park boundary")
                 modified_tracts.append(tract_id)
@@ -20,6 +20,7 @@ REQUIREMENTS:
 OUTPUT:
     - Creates: public/highland_park_commercial_buildings_with_prices.geojson
     - Progress tracking: scripts/yelp_progress.json
+    - Run history: scripts/snapshots/ (see scripts/snapshot_store.py)
 
 RATE LIMITS:
     - Check your Yelp API dashboard for current limits
@@ -32,6 +33,8 @@ import requests
 import time
 from pathlib import Path
 
+from snapshot_store import record_snapshot
+
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent.absolute()
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -249,6 +252,11 @@ def main():
     save_progress(progress)
     save_results(geojson_data, OUTPUT_FILE)
     
+    # Record this run in the snapshot history
+    version = record_snapshot(geojson_data)
+    if version is not None:
+        print(f"🗂️  Recorded snapshot version {version}")
+    
     # Summary
     print("\n" + "=" * 60)
     print("📊 SUMMARY")
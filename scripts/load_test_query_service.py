@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Highland Park Map Layers - Query Service Load Test
+
+Sends concurrent bbox, point and attribute queries to a running
+scripts/query_service.py and reports throughput and latency percentiles.
+
+USAGE:
+    1. Start the service:
+       python scripts/query_service.py
+    2. In another terminal:
+       python scripts/load_test_query_service.py --clients 16 --duration 10
+
+Uses only the standard library. Each client keeps a single keep-alive
+connection and requests gzip responses, like a browser would.
+"""
+
+import argparse
+import random
+import threading
+import time
+from http.client import HTTPConnection
+from urllib.parse import quote
+
+# ==============================
+# CONFIGURATION
+# ==============================
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Approximate Highland Park extent (lon/lat) used to generate random queries
+EXTENT = (-118.215, 34.095, -118.170, 34.135)
+
+# Width/height of random bbox queries in degrees (~100 m to ~1.5 km)
+BBOX_SIZE_RANGE = (0.001, 0.015)
+
+TYPOLOGIES = [
+    "Advanced Gentrification",
+    "Early/Ongoing Gentrification",
+    "Becoming Exclusive",
+    "Stable Moderate/Mixed Income",
+    "Low-Income/Susceptible to Displacement",
+]
+
+# ==============================
+# QUERY GENERATION
+# ==============================
+
+def random_point():
+    return random.uniform(EXTENT[0], EXTENT[2]), random.uniform(EXTENT[1], EXTENT[3])
+
+def random_bbox():
+    lon, lat = random_point()
+    width = random.uniform(*BBOX_SIZE_RANGE)
+    height = random.uniform(*BBOX_SIZE_RANGE)
+    return f"{lon:.6f},{lat:.6f},{lon + width:.6f},{lat + height:.6f}"
+
+def random_query():
+    """Return a random request path mixing the supported query kinds"""
+    kind = random.choice(['bbox', 'point', 'filter', 'bbox_filter'])
+    if kind == 'bbox':
+        layer = random.choice(['buildings', 'zoning', 'tracts'])
+        return f"/layers/{layer}?bbox={random_bbox()}"
+    if kind == 'point':
+        lon, lat = random_point()
+        layer = random.choice(['tracts', 'zoning'])
+        return f"/layers/{layer}?point={lon:.6f},{lat:.6f}"
+    if kind == 'filter':
+        level = random.randint(1, 3)
+        typology = quote(random.choice(TYPOLOGIES))
+        return f"/layers/buildings?where={quote(f'price_level>={level}')}&where=typology%3D{typology}"
+    return f"/layers/buildings?bbox={random_bbox()}&where={quote('yelp_data_found=true')}"
+
+# ==============================
+# LOAD TEST
+# ==============================
+
+def run_client(host, port, deadline, latencies, errors, lock):
+    """Send requests in a loop until the deadline, recording latencies in ms"""
+    connection = HTTPConnection(host, port, timeout=10)
+    local_latencies = []
+    local_errors = 0
+
+    while time.perf_counter() < deadline:
+        path = random_query()
+        start = time.perf_counter()
+        try:
+            connection.request('GET', path, headers={'Accept-Encoding': 'gzip'})
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                local_errors += 1
+        except OSError:
+            local_errors += 1
+            connection.close()
+            connection = HTTPConnection(host, port, timeout=10)
+            continue
+        local_latencies.append((time.perf_counter() - start) * 1000)
+
+    connection.close()
+    with lock:
+        latencies.extend(local_latencies)
+        errors[0] += local_errors
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+# ==============================
+# MAIN SCRIPT
+# ==============================
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for query_service.py")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--clients', type=int, default=8, help="number of concurrent clients")
+    parser.add_argument('--duration', type=float, default=10.0, help="test length in seconds")
+    parser.add_argument('--seed', type=int, default=None, help="random seed for reproducible queries")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    print("=" * 60)
+    print("🔥 Highland Park Map Layers - Query Service Load Test")
+    print("=" * 60)
+    print(f"\n   Target: http://{args.host}:{args.port}")
+    print(f"   Clients: {args.clients}, duration: {args.duration:.0f}s")
+
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    threads = [
+        threading.Thread(target=run_client, args=(args.host, args.port, deadline, latencies, errors, lock))
+        for _ in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print("\n" + "=" * 60)
+    print("📊 SUMMARY")
+    print("=" * 60)
+    print(f"   Requests: {len(latencies)} ({errors[0]} errors)")
+    print(f"   Throughput: {len(latencies) / elapsed:.1f} req/s")
+    print(f"   Latency p50: {percentile(latencies, 0.50):.2f} ms")
+    print(f"   Latency p95: {percentile(latencies, 0.95):.2f} ms")
+    print(f"   Latency p99: {percentile(latencies, 0.99):.2f} ms")
+    print("\n" + "=" * 60)
+
+if __name__ == "__main__":
+    main()
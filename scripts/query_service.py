@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Highland Park Map Layers - Local Feature Query Service
+
+Small HTTP service that loads the tract, zoning, building and boundary
+layers from public/ once and answers bbox, point and attribute queries from
+memory instead of downloading whole GeoJSON files.
+
+Each layer keeps:
+    - an STRtree (R-tree) over its geometries for bbox and point lookups
+    - per-field attribute indexes ({value: sorted feature indices}) for the
+      fields listed in LAYERS
+    - every feature pre-serialized to JSON, so responses are only joined
+
+Buildings also get a derived "typology" attribute: the typology of the
+gentrification tract containing the building's centroid. This makes
+"price_level>=3 within typology X" a plain attribute filter.
+
+USAGE:
+    python scripts/query_service.py [--host 127.0.0.1] [--port 8765]
+
+ENDPOINTS:
+    GET /layers                    layer names, feature counts, indexed fields
+    GET /layers/<name>?...         FeatureCollection of matching features
+
+QUERY PARAMETERS (all optional, combined with AND):
+    bbox=minlon,minlat,maxlon,maxlat   features intersecting the box
+    point=lon,lat                      features containing the point
+    where=<field><op><value>           repeatable; op is one of = != >= <= > <
+    limit=<n>                          return at most n features
+
+    String properties are compared to the value exactly as typed, so digit-only
+    IDs work (where=tract_id=6037183101). Numeric and boolean properties are
+    compared to the value parsed as a number, true/false or null.
+
+    e.g. /layers/buildings?where=price_level>=3&where=typology=Advanced Gentrification
+
+    Responses are gzip-compressed when the client sends Accept-Encoding: gzip.
+    X-Query-Time-Ms reports the lookup time without serialization.
+
+REQUIREMENTS:
+    pip install "shapely>=2.0"
+
+See scripts/load_test_query_service.py for a concurrent load test.
+"""
+
+import argparse
+import gzip
+import json
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+# Get the directory where this script is located
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# ==============================
+# CONFIGURATION
+# ==============================
+LAYERS = [
+    {"name": "tracts", "path": PROJECT_ROOT / "public" / "highland_park_gentrification_tracts.geojson",
+     "indexed_fields": ["tract_id", "typology"]},
+    {"name": "zoning", "path": PROJECT_ROOT / "public" / "highland_park_zoning.json",
+     "indexed_fields": ["CATEGORY", "Zoning"]},
+    {"name": "buildings", "path": PROJECT_ROOT / "public" / "highland_park_commercial_buildings_with_prices.geojson",
+     "indexed_fields": ["price_level", "yelp_data_found", "typology"]},
+    {"name": "boundary", "path": PROJECT_ROOT / "public" / "highland_park_only.geojson",
+     "indexed_fields": []},
+]
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Responses smaller than this are sent uncompressed (bytes)
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+
+WHERE_PATTERN = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(>=|<=|!=|=|>|<)\s*(.*?)\s*$')
+
+COMPARISONS = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '>=': lambda a, b: a >= b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '<': lambda a, b: a < b,
+}
+
+EMPTY = np.array([], dtype=np.intp)
+
+class QueryError(ValueError):
+    """Raised for malformed query parameters (answered with HTTP 400)"""
+
+# ==============================
+# HELPER FUNCTIONS
+# ==============================
+
+def load_geojson(file_path):
+    """Load a GeoJSON file and return the data."""
+    with open(str(file_path), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def parse_value(text):
+    """Convert a query string value to int, float, bool, None or str"""
+    lowered = text.lower()
+    if lowered == 'true':
+        return True
+    if lowered == 'false':
+        return False
+    if lowered in ('null', 'none'):
+        return None
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+def parse_where(clause):
+    """Parse 'field>=value' into (field, op, parsed value, raw value text)"""
+    match = WHERE_PATTERN.match(clause)
+    if not match:
+        raise QueryError(f"Invalid where clause: {clause!r}")
+    field, op, value = match.groups()
+    return field, op, parse_value(value), value
+
+def parse_floats(text, count, name):
+    """Parse a comma-separated list of exactly `count` floats"""
+    try:
+        values = [float(v) for v in text.split(',')]
+    except ValueError:
+        raise QueryError(f"{name} must be {count} comma-separated numbers")
+    if len(values) != count:
+        raise QueryError(f"{name} must be {count} comma-separated numbers")
+    return values
+
+def matches(value, op, target, raw):
+    """
+    Compare a property value to a query value. String properties are compared
+    to the raw query text, so "6037183101" matches tract_id=6037183101.
+    Booleans never equal numbers (so yelp_data_found=1 does not match True),
+    and ordering comparisons never match across mismatched types or None.
+    """
+    if isinstance(value, str):
+        return COMPARISONS[op](value, raw)
+    if op in ('=', '!='):
+        if isinstance(value, bool) != isinstance(target, bool):
+            return op == '!='
+        return COMPARISONS[op](value, target)
+    if value is None or target is None or isinstance(value, bool) != isinstance(target, bool):
+        return False
+    try:
+        return COMPARISONS[op](value, target)
+    except TypeError:
+        return False
+
+# ==============================
+# LAYER INDEX
+# ==============================
+
+class Layer:
+    """One GeoJSON layer held in memory with spatial and attribute indexes"""
+
+    def __init__(self, name, geojson_data, indexed_fields):
+        self.name = name
+        self.features = geojson_data['features']
+        self.properties = [f['properties'] for f in self.features]
+        self.geoms = np.array([shape(f['geometry']) for f in self.features], dtype=object)
+        self.tree = shapely.STRtree(self.geoms)
+        self.all_ids = np.arange(len(self.features), dtype=np.intp)
+        self.indexed_fields = list(indexed_fields)
+        self.serialized = None
+        self.attribute_index = {}
+
+    def build(self):
+        """Build attribute indexes and pre-serialize features"""
+        for field in self.indexed_fields:
+            buckets = {}
+            for i, props in enumerate(self.properties):
+                value = props.get(field)
+                # True == 1 as dict keys, so keep booleans in their own buckets
+                buckets.setdefault((type(value) is bool, value), []).append(i)
+            self.attribute_index[field] = {
+                key: np.array(ids, dtype=np.intp) for key, ids in buckets.items()
+            }
+        self.serialized = [
+            json.dumps(f, separators=(',', ':')).encode('utf-8') for f in self.features
+        ]
+        return self
+
+    def filter_ids(self, field, op, target, raw, candidates):
+        """Return the candidate indices whose `field` satisfies `op target`"""
+        index = self.attribute_index.get(field)
+        if index is not None:
+            hits = [ids for (_, value), ids in index.items() if matches(value, op, target, raw)]
+            if not hits:
+                return EMPTY
+            return np.intersect1d(candidates, np.concatenate(hits), assume_unique=True)
+
+        # Unindexed field: scan only the remaining candidates
+        return np.array(
+            [i for i in candidates if matches(self.properties[i].get(field), op, target, raw)],
+            dtype=np.intp
+        )
+
+    def query(self, bbox=None, point=None, where=(), limit=None):
+        """Return sorted indices of features matching all given conditions"""
+        ids = self.all_ids
+        if bbox is not None:
+            ids = np.unique(self.tree.query(shapely.box(*bbox), predicate='intersects'))
+        if point is not None:
+            point_ids = self.tree.query(shapely.Point(*point), predicate='intersects')
+            ids = np.intersect1d(ids, point_ids)
+
+        # Apply indexed filters first; they are the cheapest
+        clauses = sorted(where, key=lambda clause: clause[0] not in self.attribute_index)
+        for field, op, target, raw in clauses:
+            if len(ids) == 0:
+                break
+            ids = self.filter_ids(field, op, target, raw, ids)
+
+        if limit is not None:
+            ids = ids[:limit]
+        return ids
+
+    def to_collection_bytes(self, ids):
+        """Join pre-serialized features into a FeatureCollection"""
+        return (b'{"type":"FeatureCollection","features":['
+                + b','.join(self.serialized[i] for i in ids)
+                + b']}')
+
+    def describe(self):
+        return {
+            "name": self.name,
+            "features": len(self.features),
+            "indexed_fields": self.indexed_fields
+        }
+
+def add_tract_typology(buildings, tracts):
+    """Tag each building with the typology of the tract containing its centroid"""
+    centroids = shapely.centroid(buildings.geoms)
+    building_idx, tract_idx = tracts.tree.query(centroids, predicate='within')
+    for b, t in zip(building_idx, tract_idx):
+        buildings.properties[b]['typology'] = tracts.properties[t].get('typology')
+    for props in buildings.properties:
+        props.setdefault('typology', None)
+
+def load_layers(layer_configs=LAYERS):
+    """Load every configured layer that exists and build its indexes"""
+    layers = {}
+    for config in layer_configs:
+        if not Path(config['path']).exists():
+            print(f"   ⚠️  Skipping {config['name']}: {config['path']} not found")
+            continue
+        layers[config['name']] = Layer(config['name'], load_geojson(config['path']), config['indexed_fields'])
+
+    if 'buildings' in layers and 'tracts' in layers:
+        add_tract_typology(layers['buildings'], layers['tracts'])
+
+    for layer in layers.values():
+        layer.build()
+        print(f"   ✅ {layer.name}: {len(layer.features)} features")
+    return layers
+
+# ==============================
+# HTTP SERVER
+# ==============================
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """Answers GET requests against the layers stored on the server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    # Headers and body are separate writes; with Nagle's algorithm on, delayed
+    # ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        layers = self.server.layers
+
+        if parts == ['layers']:
+            body = json.dumps([layer.describe() for layer in layers.values()]).encode('utf-8')
+            self.send_body(200, body)
+            return
+
+        if len(parts) != 2 or parts[0] != 'layers':
+            self.send_error_json(404, f"Unknown path {url.path}")
+            return
+        if parts[1] not in layers:
+            self.send_error_json(404, f"Unknown layer {parts[1]}")
+            return
+
+        layer = layers[parts[1]]
+        params = parse_qs(url.query)
+        try:
+            bbox = parse_floats(params['bbox'][0], 4, 'bbox') if 'bbox' in params else None
+            point = parse_floats(params['point'][0], 2, 'point') if 'point' in params else None
+            where = [parse_where(clause) for clause in params.get('where', [])]
+            limit = int(params['limit'][0]) if 'limit' in params else None
+            if limit is not None and limit < 0:
+                raise QueryError("limit must be a non-negative integer")
+        except (QueryError, ValueError) as e:
+            self.send_error_json(400, str(e))
+            return
+
+        start = time.perf_counter()
+        ids = layer.query(bbox=bbox, point=point, where=where, limit=limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.send_body(200, layer.to_collection_bytes(ids), {
+            "X-Query-Time-Ms": f"{elapsed_ms:.3f}",
+            "X-Feature-Count": str(len(ids))
+        })
+
+    def send_body(self, status, body, headers=None):
+        """Send a JSON body, gzip-compressed if the client accepts it"""
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/geo+json' if status == 200 else 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if len(body) >= GZIP_MIN_SIZE and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_body(status, json.dumps({"error": message}).encode('utf-8'))
+
+    def log_message(self, format, *args):
+        # Keep the console quiet under load; errors still go through log_error
+        pass
+
+def make_server(host, port, layers):
+    """Create the threaded HTTP server with the loaded layers attached"""
+    server = ThreadingHTTPServer((host, port), QueryHandler)
+    server.daemon_threads = True
+    server.layers = layers
+    return server
+
+# ==============================
+# MAIN SCRIPT
+# ==============================
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve bbox/point/attribute queries over the public/ layers")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🗺️  Highland Park Map Layers - Feature Query Service")
+    print("=" * 60)
+
+    print("\n📂 Loading layers...")
+    layers = load_layers()
+
+    server = make_server(args.host, args.port, layers)
+    print(f"\n🚀 Listening on http://{args.host}:{args.port}/layers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Highland Park Commercial Buildings - Versioned Snapshot Store
+
+Keeps a history of the Yelp-enriched buildings GeoJSON across enrichment
+runs without storing a full copy per run. Every run is saved as a delta
+against the previous version:
+
+    added     buildings that are new in this run (stored in full)
+    removed   building keys that are gone in this run
+    changed   new Yelp fields (price, price_level, business_name,
+              yelp_data_found) for buildings whose Yelp fields changed
+
+Buildings are keyed by BLD_ID. Some footprints have BLD_ID "0", so those
+fall back to "OBJECTID:<id>". A building whose geometry or non-Yelp
+properties change is recorded as removed + added in the delta, and counted
+once as "replaced" in the index.
+
+Every CHECKPOINT_INTERVAL versions a full snapshot is written instead of a
+delta, so reconstructing any version replays at most CHECKPOINT_INTERVAL - 1
+deltas. Features are reconstructed in checkpoint order, with buildings added
+afterwards appended at the end.
+
+index.json lists all versions and, per version, the price_level changes
+({key: [old, new]}), so "which buildings changed price level between runs"
+is answered from the index alone without loading any snapshot.
+
+USAGE:
+    python scripts/snapshot_store.py record              # snapshot the current output file
+    python scripts/snapshot_store.py list
+    python scripts/snapshot_store.py show 3 out.geojson  # rebuild version 3
+    python scripts/snapshot_store.py diff 2 5            # price level changes from v2 to v5
+
+    scripts/fetch_yelp_prices.py records a snapshot automatically at the end
+    of each run.
+
+OUTPUT (ignored by git; the history is local to each machine):
+    - scripts/snapshots/index.json
+    - scripts/snapshots/v0001.full.json.gz, v0002.delta.json.gz, ...
+"""
+
+import argparse
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+# Get the directory where this script is located
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# ==============================
+# CONFIGURATION
+# ==============================
+SOURCE_FILE = PROJECT_ROOT / "public" / "highland_park_commercial_buildings_with_prices.geojson"
+SNAPSHOT_DIR = SCRIPT_DIR / "snapshots"
+INDEX_FILE = SNAPSHOT_DIR / "index.json"
+
+# Write a full snapshot every N versions to bound reconstruction cost
+CHECKPOINT_INTERVAL = 10
+
+# Properties added by fetch_yelp_prices.py that are expected to change between runs
+YELP_FIELDS = ['price', 'price_level', 'business_name', 'yelp_data_found']
+
+# ==============================
+# HELPER FUNCTIONS
+# ==============================
+
+def building_key(properties):
+    """Return the key identifying a building across runs"""
+    bld_id = properties.get('BLD_ID')
+    if bld_id and str(bld_id) != '0':
+        return str(bld_id)
+    return f"OBJECTID:{properties.get('OBJECTID')}"
+
+def split_feature(feature):
+    """Split a feature into (static part, Yelp fields)"""
+    props = feature['properties']
+    static = dict(feature)
+    static['properties'] = {k: v for k, v in props.items() if k not in YELP_FIELDS}
+    yelp = {k: props[k] for k in YELP_FIELDS if k in props}
+    return static, yelp
+
+def index_features(geojson_data):
+    """Return (ordered keys, {key: feature}) for a FeatureCollection"""
+    order = []
+    features = {}
+    for feature in geojson_data['features']:
+        key = building_key(feature['properties'])
+        if key in features:
+            raise ValueError(f"Duplicate building key {key}")
+        order.append(key)
+        features[key] = feature
+    return order, features
+
+def collection_meta(geojson_data):
+    """Top-level FeatureCollection members other than the features"""
+    return {k: v for k, v in geojson_data.items() if k != 'features'}
+
+def compute_delta(old_data, new_data):
+    """Compute the delta that turns old_data into new_data"""
+    _, old_features = index_features(old_data)
+    new_order, new_features = index_features(new_data)
+
+    added = {}
+    changed = {}
+    for key in new_order:
+        new_feature = new_features[key]
+        if key not in old_features:
+            added[key] = new_feature
+            continue
+
+        old_static, old_yelp = split_feature(old_features[key])
+        new_static, new_yelp = split_feature(new_feature)
+        if old_static != new_static:
+            # Footprint itself changed: store the whole feature
+            added[key] = new_feature
+        elif old_yelp != new_yelp:
+            changed[key] = new_yelp
+
+    removed = [key for key in old_features if key not in new_features]
+    # Re-added buildings must be removed first so they move to the end
+    removed += [key for key in added if key in old_features]
+
+    delta = {"added": added, "removed": removed, "changed": changed}
+    if collection_meta(old_data) != collection_meta(new_data):
+        delta["meta"] = collection_meta(new_data)
+    return delta
+
+def apply_delta(geojson_data, delta):
+    """Apply a delta produced by compute_delta and return the new collection"""
+    order, features = index_features(geojson_data)
+
+    removed = set(delta['removed'])
+    new_features = []
+    for key in order:
+        if key in removed:
+            continue
+        feature = features[key]
+        if key in delta['changed']:
+            feature, _ = split_feature(feature)
+            feature['properties'].update(delta['changed'][key])
+        new_features.append(feature)
+    new_features.extend(delta['added'].values())
+
+    result = dict(delta.get('meta', collection_meta(geojson_data)))
+    result['features'] = new_features
+    return result
+
+def price_level_changes(old_data, new_data):
+    """Return {key: [old, new]} for buildings whose price_level differs"""
+    old_levels = {}
+    if old_data is not None:
+        old_levels = {building_key(f['properties']): f['properties'].get('price_level')
+                      for f in old_data['features']}
+    new_levels = {building_key(f['properties']): f['properties'].get('price_level')
+                  for f in new_data['features']}
+
+    changes = {}
+    for key in old_levels.keys() | new_levels.keys():
+        old_level = old_levels.get(key)
+        new_level = new_levels.get(key)
+        if old_level != new_level:
+            changes[key] = [old_level, new_level]
+    return changes
+
+def read_gz_json(file_path):
+    """Load a gzip-compressed JSON file"""
+    with gzip.open(str(file_path), 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_gz_json(data, file_path):
+    """Save data as compact gzip-compressed JSON"""
+    with gzip.open(str(file_path), 'wt', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+def load_index():
+    """Load the snapshot index, or an empty one if no snapshots exist yet"""
+    if INDEX_FILE.exists():
+        with open(str(INDEX_FILE), 'r') as f:
+            return json.load(f)
+    return {"versions": []}
+
+def save_index(index):
+    """Save the snapshot index"""
+    with open(str(INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=2)
+
+def get_version_entry(index, version):
+    """Return the index entry for a version number"""
+    versions = index['versions']
+    if not 1 <= version <= len(versions):
+        raise ValueError(f"Version {version} does not exist (have 1-{len(versions)})")
+    return versions[version - 1]
+
+# ==============================
+# STORE OPERATIONS
+# ==============================
+
+def reconstruct_version(version, index=None):
+    """Rebuild the FeatureCollection as it was at the given version"""
+    if index is None:
+        index = load_index()
+    get_version_entry(index, version)
+
+    # Walk back to the nearest full snapshot, then replay deltas forward
+    checkpoint = version
+    while index['versions'][checkpoint - 1]['kind'] != 'full':
+        checkpoint -= 1
+
+    data = read_gz_json(SNAPSHOT_DIR / index['versions'][checkpoint - 1]['file'])
+    for v in range(checkpoint + 1, version + 1):
+        data = apply_delta(data, read_gz_json(SNAPSHOT_DIR / index['versions'][v - 1]['file']))
+    return data
+
+def record_snapshot(geojson_data):
+    """
+    Record geojson_data as a new version.
+    Returns the new version number, or None if nothing changed since the last one.
+    """
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    index = load_index()
+    versions = index['versions']
+    version = len(versions) + 1
+
+    previous = reconstruct_version(version - 1, index) if versions else None
+    if previous is not None:
+        delta = compute_delta(previous, geojson_data)
+        if not (delta['added'] or delta['removed'] or delta['changed'] or 'meta' in delta):
+            return None
+
+    entry = {
+        "version": version,
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "buildings": len(geojson_data['features'])
+    }
+
+    if previous is None or (version - 1) % CHECKPOINT_INTERVAL == 0:
+        entry['kind'] = 'full'
+        entry['file'] = f"v{version:04d}.full.json.gz"
+        write_gz_json(geojson_data, SNAPSHOT_DIR / entry['file'])
+    else:
+        entry['kind'] = 'delta'
+        entry['file'] = f"v{version:04d}.delta.json.gz"
+        write_gz_json(delta, SNAPSHOT_DIR / entry['file'])
+
+    if previous is not None:
+        # Buildings stored as removed + added count once, as replaced
+        replaced = len(set(delta['removed']) & delta['added'].keys())
+        entry['added'] = len(delta['added']) - replaced
+        entry['removed'] = len(delta['removed']) - replaced
+        entry['changed'] = len(delta['changed'])
+        entry['replaced'] = replaced
+    entry['price_level_changes'] = price_level_changes(previous, geojson_data)
+
+    versions.append(entry)
+    save_index(index)
+    return version
+
+def price_level_changes_between(from_version, to_version, index=None):
+    """
+    Return {key: [level at from_version, level at to_version]} for every
+    building whose price_level differs between the two versions.
+    Uses only the index; no snapshot files are read.
+    """
+    if index is None:
+        index = load_index()
+    get_version_entry(index, from_version)
+    get_version_entry(index, to_version)
+    if from_version > to_version:
+        return {key: [new, old] for key, (old, new)
+                in price_level_changes_between(to_version, from_version, index).items()}
+
+    changes = {}
+    for v in range(from_version + 1, to_version + 1):
+        for key, (old, new) in index['versions'][v - 1]['price_level_changes'].items():
+            start = changes[key][0] if key in changes else old
+            changes[key] = [start, new]
+    return {key: levels for key, levels in changes.items() if levels[0] != levels[1]}
+
+# ==============================
+# MAIN SCRIPT
+# ==============================
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned snapshots of the enriched buildings GeoJSON")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('record', help="record the current output file as a new version")
+    subparsers.add_parser('list', help="list recorded versions")
+    show_parser = subparsers.add_parser('show', help="rebuild a past version")
+    show_parser.add_argument('version', type=int)
+    show_parser.add_argument('output', help="path to write the rebuilt GeoJSON to")
+    diff_parser = subparsers.add_parser('diff', help="buildings whose price level changed between versions")
+    diff_parser.add_argument('from_version', type=int)
+    diff_parser.add_argument('to_version', type=int)
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        with open(str(SOURCE_FILE), 'r') as f:
+            geojson_data = json.load(f)
+        version = record_snapshot(geojson_data)
+        if version is None:
+            print("⚪ No changes since the last snapshot, nothing recorded")
+        else:
+            print(f"💾 Recorded version {version} in {SNAPSHOT_DIR}")
+
+    elif args.command == 'list':
+        for entry in load_index()['versions']:
+            counts = ""
+            if 'changed' in entry:
+                counts = (f"  +{entry['added']} -{entry['removed']} ~{entry['changed']}"
+                          f" ({entry.get('replaced', 0)} replaced)")
+            print(f"v{entry['version']:<4} {entry['created']}  {entry['kind']:<5} "
+                  f"{entry['buildings']} buildings{counts}  "
+                  f"{len(entry['price_level_changes'])} price level changes")
+
+    elif args.command == 'show':
+        data = reconstruct_version(args.version)
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"💾 Saved version {args.version} ({len(data['features'])} buildings) to: {args.output}")
+
+    elif args.command == 'diff':
+        changes = price_level_changes_between(args.from_version, args.to_version)
+        for key, (old, new) in sorted(changes.items()):
+            print(f"{key}: {old} -> {new}")
+        print(f"\n📊 {len(changes)} building(s) changed price level between v{args.from_version} and v{args.to_version}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Highland Park Map Layers - Geometry Validation and Repair
+
+Checks every polygon layer in public/ for invalid geometry and, for the
+layers that are supposed to tile the area (tracts, zoning), for overlapping
+or sliver pairs and for gaps between features.
+
+Validity is checked and repaired with vectorized shapely calls over whole
+layers (is_valid / make_valid). Overlaps are found with an STRtree query, so
+only pairs whose bounding boxes touch are intersected instead of all n^2
+pairs.
+
+Areas are reported in square meters using a local equirectangular scaling
+around the layer's mean latitude, which is accurate enough at neighborhood
+scale.
+
+USAGE:
+    python scripts/validate_geometry.py          # write the report only
+    python scripts/validate_geometry.py --fix    # also write repaired layers back
+
+REQUIREMENTS:
+    pip install "shapely>=2.0"
+
+OUTPUT:
+    - scripts/geometry_report.json
+"""
+
+import argparse
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+import shapely
+from shapely.geometry import mapping, shape
+
+# Get the directory where this script is located
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# ==============================
+# CONFIGURATION
+# ==============================
+REPORT_FILE = SCRIPT_DIR / "geometry_report.json"
+
+# Layers to validate. check_coverage enables the overlap / sliver / gap checks.
+LAYERS = [
+    {"name": "tracts", "path": PROJECT_ROOT / "public" / "highland_park_gentrification_tracts.geojson",
+     "id_field": "tract_id", "check_coverage": True},
+    {"name": "zoning", "path": PROJECT_ROOT / "public" / "highland_park_zoning.json",
+     "id_field": "OBJECTID", "check_coverage": True},
+    {"name": "buildings", "path": PROJECT_ROOT / "public" / "highland_park_commercial_buildings_footprint.geojson",
+     "id_field": "OBJECTID", "check_coverage": False},
+    {"name": "buildings_with_prices", "path": PROJECT_ROOT / "public" / "highland_park_commercial_buildings_with_prices.geojson",
+     "id_field": "OBJECTID", "check_coverage": False},
+    {"name": "boundary", "path": PROJECT_ROOT / "public" / "highland_park_only.geojson",
+     "id_field": "OBJECTID", "check_coverage": False},
+]
+
+# Intersections smaller than this are treated as shared-edge noise (m^2)
+MIN_OVERLAP_AREA = 1.0
+
+# Intersections or gaps below this area, or thinner than SLIVER_THINNESS, are slivers (m^2)
+SLIVER_MAX_AREA = 500.0
+
+# Polsby-Popper compactness (4*pi*A / P^2) below which a shape counts as a sliver
+SLIVER_THINNESS = 0.05
+
+METERS_PER_DEGREE = 111320.0
+
+# ==============================
+# HELPER FUNCTIONS
+# ==============================
+
+def load_geojson(file_path):
+    """Load a GeoJSON file and return the data."""
+    with open(str(file_path), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_geojson(data, file_path):
+    """Save data to a GeoJSON file."""
+    with open(str(file_path), 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+def features_to_array(features):
+    """Convert GeoJSON features to a numpy array of shapely geometries (None if missing)"""
+    return np.array(
+        [shape(f['geometry']) if f.get('geometry') else None for f in features],
+        dtype=object
+    )
+
+def to_local_meters(geoms):
+    """Scale lon/lat geometries to approximate meters around their mean latitude"""
+    valid = geoms[~shapely.is_missing(geoms)]
+    if len(valid) == 0:
+        return geoms
+    bounds = shapely.total_bounds(valid)
+    mean_lat = (bounds[1] + bounds[3]) / 2
+    scale = np.array([METERS_PER_DEGREE * math.cos(math.radians(mean_lat)), METERS_PER_DEGREE])
+    return shapely.transform(geoms, lambda coords: coords * scale)
+
+def polygonal_part(geom):
+    """
+    Keep only the polygonal parts of a geometry. make_valid can return a
+    GeometryCollection with stray lines or points, which GeoJSON polygon
+    layers cannot hold.
+    """
+    if geom is None or geom.geom_type in ('Polygon', 'MultiPolygon'):
+        return geom
+    parts = [p for p in shapely.get_parts(geom) if p.geom_type in ('Polygon', 'MultiPolygon')]
+    if not parts:
+        return shapely.Polygon()
+    return shapely.unary_union(parts)
+
+def thinness(geoms):
+    """Polsby-Popper compactness: 1 for a circle, near 0 for long thin shapes"""
+    perimeter = shapely.length(geoms)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(perimeter > 0, 4 * math.pi * shapely.area(geoms) / perimeter ** 2, 0.0)
+
+def feature_ids(features, id_field):
+    """Return a display id for each feature, falling back to its index"""
+    return [str(f['properties'].get(id_field, i)) for i, f in enumerate(features)]
+
+# ==============================
+# CHECKS
+# ==============================
+
+def validate_and_repair(geoms, ids):
+    """
+    Check validity of a whole layer at once and repair invalid geometries.
+    Returns (repaired geometries, list of issue dicts).
+    """
+    missing = shapely.is_missing(geoms)
+    valid = shapely.is_valid(geoms) | missing
+    empty = shapely.is_empty(geoms) & ~missing
+
+    issues = []
+    for i in np.flatnonzero(missing):
+        issues.append({"id": ids[i], "issue": "missing_geometry"})
+    for i in np.flatnonzero(empty):
+        issues.append({"id": ids[i], "issue": "empty_geometry"})
+
+    repaired = geoms.copy()
+    invalid_idx = np.flatnonzero(~valid)
+    if len(invalid_idx):
+        reasons = shapely.is_valid_reason(geoms[invalid_idx])
+        fixed = shapely.make_valid(geoms[invalid_idx])
+        for i, reason, geom in zip(invalid_idx, reasons, fixed):
+            geom = polygonal_part(geom)
+            repaired[i] = geom
+            issues.append({
+                "id": ids[i],
+                "issue": "invalid_geometry",
+                "reason": reason,
+                "repaired_type": geom.geom_type,
+                "repaired": not geom.is_empty
+            })
+
+    return repaired, issues
+
+def find_overlaps(geoms, ids):
+    """
+    Find overlapping and sliver pairs with an STRtree bounding-box query,
+    then intersect only the candidate pairs.
+    """
+    present = np.flatnonzero(~shapely.is_missing(geoms) & ~shapely.is_empty(geoms))
+    layer = geoms[present]
+    metric = to_local_meters(layer)
+
+    tree = shapely.STRtree(layer)
+    left, right = tree.query(layer, predicate='intersects')
+    keep = left < right
+    left, right = left[keep], right[keep]
+    if len(left) == 0:
+        return []
+
+    intersections = shapely.intersection(metric[left], metric[right])
+    areas = shapely.area(intersections)
+    compactness = thinness(intersections)
+
+    results = []
+    for a, b, area, compact in zip(left, right, areas, compactness):
+        if area < MIN_OVERLAP_AREA:
+            continue
+        kind = "sliver" if area < SLIVER_MAX_AREA or compact < SLIVER_THINNESS else "overlap"
+        results.append({
+            "ids": [ids[present[a]], ids[present[b]]],
+            "issue": kind,
+            "area_m2": round(float(area), 2),
+            "thinness": round(float(compact), 4)
+        })
+    return results
+
+def find_gaps(geoms):
+    """Find holes in the union of a layer that no feature covers"""
+    present = geoms[~shapely.is_missing(geoms) & ~shapely.is_empty(geoms)]
+    union = shapely.union_all(present)
+
+    holes = []
+    for polygon in shapely.get_parts(union):
+        if polygon.geom_type != 'Polygon':
+            continue
+        holes.extend(shapely.Polygon(ring) for ring in polygon.interiors)
+    if not holes:
+        return []
+
+    holes = np.array(holes, dtype=object)
+    metric = to_local_meters(holes)
+    areas = shapely.area(metric)
+    compactness = thinness(metric)
+
+    results = []
+    for hole, area, compact in zip(holes, areas, compactness):
+        if area < MIN_OVERLAP_AREA:
+            continue
+        point = hole.representative_point()
+        results.append({
+            "issue": "sliver_gap" if area < SLIVER_MAX_AREA or compact < SLIVER_THINNESS else "gap",
+            "area_m2": round(float(area), 2),
+            "thinness": round(float(compact), 4),
+            "location": [round(point.x, 6), round(point.y, 6)]
+        })
+    return results
+
+def check_layer(layer, fix=False):
+    """Run all checks on one layer and return its report section"""
+    data = load_geojson(layer['path'])
+    features = data['features']
+    ids = feature_ids(features, layer['id_field'])
+    geoms = features_to_array(features)
+
+    repaired, issues = validate_and_repair(geoms, ids)
+    report = {
+        "file": os.path.relpath(layer['path'], PROJECT_ROOT),
+        "features": len(features),
+        "invalid": sum(1 for issue in issues if issue['issue'] == 'invalid_geometry'),
+        "validity_issues": issues
+    }
+
+    if layer['check_coverage']:
+        report['overlaps'] = find_overlaps(repaired, ids)
+        report['gaps'] = find_gaps(repaired)
+
+    if fix and report['invalid']:
+        for i, feature in enumerate(features):
+            if repaired[i] is not geoms[i]:
+                feature['geometry'] = mapping(repaired[i])
+        save_geojson(data, layer['path'])
+        report['repaired_file_written'] = True
+
+    return report
+
+# ==============================
+# MAIN SCRIPT
+# ==============================
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and repair map layer geometry")
+    parser.add_argument('--fix', action='store_true', help="write repaired geometries back to the layer files")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧭 Highland Park Map Layers - Geometry Validation")
+    print("=" * 60)
+
+    report = {"layers": {}}
+    for layer in LAYERS:
+        if not Path(layer['path']).exists():
+            print(f"\n⚠️  Skipping {layer['name']}: {layer['path']} not found")
+            continue
+
+        section = check_layer(layer, fix=args.fix)
+        report['layers'][layer['name']] = section
+
+        print(f"\n📂 {layer['name']}: {section['features']} features")
+        print(f"   {'❌' if section['invalid'] else '✅'} {section['invalid']} invalid geometries")
+        if 'overlaps' in section:
+            overlaps = sum(1 for o in section['overlaps'] if o['issue'] == 'overlap')
+            slivers = len(section['overlaps']) - overlaps
+            print(f"   🔍 {overlaps} overlapping pairs, {slivers} sliver pairs, {len(section['gaps'])} gaps")
+        if section.get('repaired_file_written'):
+            print(f"   💾 Wrote repaired geometries to {section['file']}")
+
+    with open(str(REPORT_FILE), 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved report to: {REPORT_FILE}")
+    print("\n" + "=" * 60)
+
+if __name__ == "__main__":
+    main()